@@ -4,15 +4,260 @@ Apple Music Radio Schedule Scraper
 Extracts show information from multiple Apple Music radio stations using Playwright.
 """
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
+import diskcache
+import aiohttp
+import asyncio
+import csv
+import functools
+import hashlib
+import itertools
+import os
 import json
+import logging
+import multiprocessing
 import re
-import pandas as pd
-from datetime import datetime
-import pytz
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-show/per-slot diagnostics go here rather than stdout so they stay out of the hot path
+logger = logging.getLogger(__name__)
+
+# Fewest shows that count as a real schedule rather than a stray block: the plain HTTP
+# attempt only skips Playwright, and the in-page pass only skips the soup parse, at this many
+_MIN_SCHEDULE_SHOWS = 3
+
+# Plain HTTP attempt made before falling back to the browser
+_HTTP_TIMEOUT_SECONDS = 20
+# Keep-alive pool for the shared session; every station is on music.apple.com
+_HTTP_POOL_SIZE = 16
+_HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Maximum number of station pages rendered at the same time on the shared browser
+_MAX_CONCURRENT_PAGES = 3
+
+# On-disk page cache; schedules change hourly, so a fetched page stays fresh for 15 minutes
+_CACHE_DIR = '.scrape_cache'
+_CACHE_TTL_SECONDS = 900
+# Plain-HTTP bodies are kept longer, keyed with their ETag/Last-Modified for revalidation
+_HTTP_VALIDATOR_TTL_SECONDS = 7 * 24 * 3600
+
+# Longer candidate URLs are skipped without scanning them (real mzstatic URLs are ~150 chars)
+_MAX_ARTWORK_URL_LEN = 2048
+
+# How many image_data keys to substring-scan when the exact key lookup misses
+_IMAGE_KEY_SCAN_LIMIT = 20
+
+# Resource types that are never needed to read the schedule DOM
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# After a scroll, the schedule counts as rendered once its number of time ranges has
+# held steady for _SETTLE_QUIET_MS (polled in the page), giving up after _SETTLE_TIMEOUT_MS
+_SETTLE_QUIET_MS = 500
+_SETTLE_TIMEOUT_MS = 5000
+_SCHEDULE_SETTLED_JS = r"""
+    (quietMs) => {
+        const timeRangeRe = /\d{1,2}(?::\d{2})?\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)/gi;
+        const count = (document.body.textContent.match(timeRangeRe) || []).length;
+        const state = window.__scheduleSettle;
+        if (!state || state.count !== count) {
+            window.__scheduleSettle = {count: count, since: performance.now()};
+            return false;
+        }
+        return performance.now() - state.since >= quietMs;
+    }
+"""
+
+# Chromium flags for a faster, leaner headless launch in CI containers
+# (small /dev/shm, no GPU); image decoding is off as well as blocked above
+_CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--blink-settings=imagesEnabled=false'
+]
+
+# Resolve the Pacific zone once rather than on every conversion/save
+_PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
+
+# Column order of the CSV output
+_CSV_FIELDS = ['station', 'time_slot_pacific', 'show_title', 'description',
+               'show_image_url', 'time_slot_utc', 'show_url', 'scraped_at']
+
+# Arbitrary midnight used to do clock arithmetic on bare HH:MM values
+_CLOCK_BASE = datetime(2000, 1, 1)
+
+# Substrings that mark a URL as show artwork (single case-insensitive scan)
+_ARTWORK_KEYWORDS_RE = re.compile(r'artwork|image|thumb|cover|\.jpg|\.png|\.webp', re.I)
+
+# Attribute names that may carry an artwork URL
+_ATTR_HINT_RE = re.compile(r'artwork|image|thumb', re.I)
+
+# CSS background-image URL in a style attribute
+_BG_URL_RE = re.compile(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)')
+
+# Time slot text, optionally prefixed with "LIVE ·" (schedule fallback scan)
+_LIVE_TIME_RANGE_RE = re.compile(r'(?:LIVE\s*[·•]?\s*)?\d{1,2}(?::\d{2})?\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)', re.I)
+
+# The schedule lives in <body>; skip building nodes for <head> (inline styles,
+# preload links, serialized app state) when falling back to the HTML parse
+_BODY_ONLY = SoupStrainer('body')
+
+# Elements holding a show's title / description; shared by the soup parse and the in-page pass
+_TITLE_SELECTOR = 'strong, b, [class*="title"], [class*="heading"], h1, h2, h3, h4, h5, h6'
+_DESC_SELECTOR = 'p, [class*="description"], [class*="subtitle"], [class*="summary"]'
+
+# Class tokens / tag names marking the container a fallback time node belongs to
+_CONTAINER_HINTS = frozenset(('item', 'card', 'container', 'section'))
+
+# Exact titles of navigation links that get picked up as schedule items
+_NAV_ITEMS = frozenset({'home', 'new', 'radio', 'search', 'sign in'})
+
+# Keywords that make an untimed entry a special show ("Playlist", "Takeover", ...)
+_SHOW_KEYWORD_RE = re.compile(r'show|list|takeover|hits', re.I)
+
+# Any time range in show text: "7 – 9 PM", "7:05 PM – 9 AM", "11PM – 12AM", "2:55 – 5:15 AM", ...
+# (optional minutes and start period; the end time always carries AM/PM)
+_ANY_TIME_RE = re.compile(r'(\d{1,2}(?::\d{2})?(?:\s*(?:AM|PM))?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))', re.I)
+
+# 12-hour time slot accepted by _convert_12h_to_24h, with AM/PM optional on either end:
+# "10:10 PM – 12:15 AM", "9 – 10 PM", "5 – 7"
+_TIME_SLOT_12H_RE = re.compile(
+    r'(?P<sh>\d{1,2})(?::(?P<sm>\d{2}))?\s*(?P<sp>AM|PM)?\s*[–-]\s*'
+    r'(?P<eh>\d{1,2})(?::(?P<em>\d{2}))?\s*(?P<ep>AM|PM)?',
+    re.I
+)
+
+# 24-hour time slots: "23:00 – 01:00" as hour/minute groups, and as start/end strings
+_TIME_24H_RANGE_RE = re.compile(r'(\d{1,2}):(\d{2})\s*[–-]\s*(\d{1,2}):(\d{2})')
+_TIME_24H_SLOT_RE = re.compile(r'(\d{1,2}:\d{2})\s*[–-]\s*(\d{1,2}:\d{2})')
+_AM_PM_RE = re.compile(r'(AM|PM)', re.I)
+
+# First 24-hour hour of each half of the day
+_PERIOD_BASE_HOUR = {'AM': 0, 'PM': 12}
+
+# A single clock time: "7:05 PM"/"11PM" (hour, minute, period) or bare "7:05"/"11"
+_CLOCK_12H_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM)', re.I)
+_CLOCK_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?')
+
+# A time range with nothing else, e.g. "7 – 9 PM" (never a title or description)
+_BARE_TIME_RANGE_RE = re.compile(r'^\d{1,2}\s*[–-]\s*\d{1,2}\s*(AM|PM)$', re.I)
+
+# Title/description cleanup passes used by _clean_title_description
+_LIVE_PREFIX_RE = re.compile(r'^LIVE\s*[·•]?\s*', re.I)
+_LEADING_TIME_RANGE_RE = re.compile(r'^(?:LIVE\s*[·•]?\s*)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', re.I)
+_LEADING_END_PERIOD_RANGE_RE = re.compile(r'^(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', re.I)
+_MID_LIVE_TIME_RE = re.compile(r'LIVE\s*[·•]\s*(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', re.I)
+_REPEATED_TIME_RE = re.compile(r'(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*\1\s*', re.I)
+_TIME_TITLE_SPLIT_RE = re.compile(r'^(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))([A-Za-z].*)$', re.I)
+_SHOW_ENDING_RE = re.compile(r'(Show|List|Hits|Radio|Music)([A-Z][a-z])')
+_CONCAT_WORD_RE = re.compile(r'([a-z])([A-Z][a-z])')
+
+# srcset candidate with its width descriptor, e.g. "https://.../632x632bb.webp 632w"
+_SRCSET_RE = re.compile(r'([^\s,]+)\s+(\d+)w')
+
+_SLOT_START_24H_RE = re.compile(r'(\d{1,2}):(\d{2})\s*[–-]')
+_SLOT_START_12H_RE = re.compile(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)?\s*[–-]', re.I)
+_SLOT_END_PERIOD_RE = re.compile(r'[–-]\s*\d{1,2}(?::\d{2})?\s*(AM|PM)', re.I)
+
+@functools.lru_cache(maxsize=1024)
+def _time_slot_to_start_minutes(time_slot: str) -> int:
+    """Convert a time slot's start time to minutes since midnight (handles both 12h and 24h formats)."""
+    if not time_slot or '***' in str(time_slot):
+        return 9999  # Put gaps at end
+    
+    # Try 24-hour format first: "14:00 – 16:00"
+    time_match_24h = _SLOT_START_24H_RE.search(str(time_slot))
+    if time_match_24h:
+        hour = int(time_match_24h.group(1))
+        minute = int(time_match_24h.group(2))
+        return hour * 60 + minute
+    
+    # Fallback to 12-hour format parsing
+    time_match = _SLOT_START_12H_RE.search(str(time_slot))
+    if time_match:
+        start_str = time_match.group(1)
+        period = time_match.group(2)  # AM/PM directly attached to start time
+        
+        # If no AM/PM attached to start time, infer from context
+        if not period:
+            # Look for AM/PM later in the string for end time
+            end_match = _SLOT_END_PERIOD_RE.search(str(time_slot))
+            if end_match:
+                end_period = end_match.group(1).upper()
+                start_hour = int(start_str.split(':')[0])  # Extract just the hour part
+                if end_period == 'AM' and start_hour >= 10:  # Like "11PM – 1AM"
+                    period = 'PM'  # Late night hours crossing midnight
+                elif end_period == 'PM' and start_hour <= 8:  # Like "5 – 7PM"  
+                    period = 'PM'  # Afternoon/evening hours
+                else:
+                    period = end_period  # Default to same as end time
+            else:
+                period = 'AM'  # Default
+        else:
+            period = period.upper()
+        
+        # Parse time
+        if ':' in start_str:
+            hour, minute = map(int, start_str.split(':'))
+        else:
+            hour, minute = int(start_str), 0
+        
+        # Convert to 24-hour for sorting
+        if period == 'PM' and hour != 12:
+            hour += 12
+        elif period == 'AM' and hour == 12:
+            hour = 0
+        
+        return hour * 60 + minute
+    
+    return 9999
+
+def _image_key(text: str) -> str:
+    """Canonical image_data key for a show block: whitespace removed, first 64 chars."""
+    # Must match the key built in the page.evaluate pass of _fetch_one
+    return ''.join(text.split())[:64]
+
+def _is_artwork_candidate(url: str) -> bool:
+    """Cheap prefix/length/suffix checks that rule a URL out before any keyword scan."""
+    # Inline data: URIs (often kilobytes of base64) and tracking pixels are never show artwork
+    return (bool(url) and len(url) <= _MAX_ARTWORK_URL_LEN
+            and not url.startswith('data:') and not url.endswith('1x1.gif'))
+
+@dataclass(slots=True)
+class Show:
+    """A single schedule entry scraped from a station page."""
+    time_slot: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    artwork_url: Optional[str]
+    show_url: Optional[str]
+    raw_text: str = ''
+    station: str = ''
+    station_url: str = ''
+    
+    def to_dict(self) -> Dict:
+        """Return the public fields written to the JSON output."""
+        return asdict(self)
+
 class AppleMusicScheduleScraper:
     def __init__(self):
         self.stations = {
@@ -24,51 +269,143 @@ class AppleMusicScheduleScraper:
             "Apple Musica Uno": "https://music.apple.com/radio/ra.1740613864"
         }
         
-    def fetch_page(self, url: str) -> tuple[Optional[str], dict]:
-        """Fetch a specific Apple Music radio page using Playwright and extract image URLs."""
+        # Compile the per-element CSS selectors once instead of on every select() call
+        self._sel_title = sv.compile(_TITLE_SELECTOR)
+        self._sel_desc = sv.compile(_DESC_SELECTOR)
+        
+        # Shared Chromium instance, launched lazily and reused across stations
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = None
+        
+        # Pacific Time offset for this run (UTC-8 for PST, UTC-7 for PDT)
+        self._pacific_offset = 7 if datetime.now(_PACIFIC_TZ).dst() else 8
+        
+        # Page cache, opened lazily on first fetch
+        self._cache = None
+        
+    @staticmethod
+    def _chromium_args() -> List[str]:
+        """Launch flags for Chromium, dropping the sandbox only where it cannot start."""
+        # Chromium's sandbox refuses to run as root, which is the norm in CI containers
+        if getattr(os, 'geteuid', lambda: -1)() == 0 or os.environ.get('CI'):
+            return _CHROMIUM_ARGS + ['--no-sandbox']
+        return _CHROMIUM_ARGS
+    
+    async def _get_browser(self):
+        """Return the shared browser, launching Chromium on first use."""
+        # Concurrent station fetches may get here together; only the first one launches
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True, args=self._chromium_args())
+        return self._browser
+    
+    def _get_cache(self) -> diskcache.Cache:
+        """Return the on-disk page cache, opening it on first use."""
+        if self._cache is None:
+            self._cache = diskcache.Cache(_CACHE_DIR)
+        return self._cache
+    
+    async def close(self):
+        """Close the shared browser, stop Playwright and close the page cache."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self._browser_lock = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Abort requests for images, media, fonts and stylesheets."""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @staticmethod
+    async def _wait_for_schedule_to_settle(page):
+        """Wait until the number of time ranges on the page stops changing, up to a cap."""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                # Create browser context with Pacific Time timezone
-                context = browser.new_context(
+            await page.wait_for_function(
+                _SCHEDULE_SETTLED_JS, arg=_SETTLE_QUIET_MS, polling=100, timeout=_SETTLE_TIMEOUT_MS
+            )
+        except Exception:
+            # Still changing at the cap; parse whatever has rendered so far
+            pass
+    
+    async def _fetch_one(self, url: str, semaphore: asyncio.Semaphore) -> tuple[Optional[str], dict, list]:
+        """Fetch a specific Apple Music radio page on the shared browser and extract image URLs and pre-split shows."""
+        # Skip the browser entirely if this page was fetched within the cache TTL
+        # (the prefix versions the cached payload shape: html, image_data, prefetched_shows)
+        cache_key = hashlib.sha1(f'v5:{url}'.encode()).hexdigest()
+        cached = self._get_cache().get(cache_key)
+        if cached is not None:
+            print(f"Using cached page for {url}")
+            return cached
+        
+        async with semaphore:
+            context = None
+            try:
+                browser = await self._get_browser()
+                # Create a fresh browser context per page (Pacific Time timezone) for isolation
+                context = await browser.new_context(
                     timezone_id='America/Los_Angeles',
                     locale='en-US'
                 )
-                page = context.new_page()
+                page = await context.new_page()
                 
-                # Navigate to the page
-                page.goto(url, wait_until="networkidle")
+                # Only the DOM is needed - src/srcset attributes are still present even
+                # when the image, font and stylesheet bytes are never downloaded
+                await page.route("**/*", self._block_heavy_resources)
                 
-                # Wait for schedule content to load
-                page.wait_for_timeout(5000)
+                # Navigate to the page; the schedule is rendered client-side, so wait
+                # for the content we need instead of network idle plus fixed sleeps
+                await page.goto(url, wait_until="domcontentloaded")
                 
-                # Wait for images to load - look for the actual Apple Music image domains
+                # Wait for artwork to be rendered - look for the actual Apple Music image domains.
+                # Image bytes are blocked, so wait for the element to exist rather than be visible
                 try:
-                    page.wait_for_function(
-                        "() => document.querySelectorAll('img[src*=\"mzstatic.com\"]').length > 0 || "
-                        "document.querySelectorAll('img[src*=\"artwork\"]').length > 0 || "
-                        "document.querySelectorAll('[style*=\"mzstatic.com\"]').length > 0",
-                        timeout=15000
-                    )
-                except:
+                    await page.locator(
+                        'img[src*="mzstatic.com"], img[src*="artwork"], [style*="mzstatic.com"]'
+                    ).first.wait_for(state='attached', timeout=15000)
+                except Exception:
                     print(f"Images may not have fully loaded for {url}")
                 
-                # Additional wait for dynamic content and lazy loading
-                page.wait_for_timeout(3000)
-                
-                # Scroll down to trigger lazy loading
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(2000)
+                # Scroll down to trigger lazy loading, and give the new blocks time to render
+                await page.evaluate("window.__scheduleSettle = null; window.scrollTo(0, document.body.scrollHeight)")
+                await self._wait_for_schedule_to_settle(page)
                 
                 # Scroll back up
-                page.evaluate("window.scrollTo(0, 0)")
-                page.wait_for_timeout(1000)
+                await page.evaluate("window.__scheduleSettle = null; window.scrollTo(0, 0)")
+                await self._wait_for_schedule_to_settle(page)
                 
                 # Extract image URLs using JavaScript
-                image_data = page.evaluate("""
-                    () => {
+                image_data = await page.evaluate("""
+                    (selectors) => {
                         const imageMap = {};
                         
+                        // Same text bs4's get_text(separator, strip=True) yields: each text node
+                        // stripped, empty ones dropped - independent of layout and CSS
+                        const strippedText = (node, separator) => {
+                            const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+                            const parts = [];
+                            while (walker.nextNode()) {
+                                const part = walker.currentNode.nodeValue.trim();
+                                if (part) {
+                                    parts.push(part);
+                                }
+                            }
+                            return parts.join(separator);
+                        };
+                        
                         // Get all images 
                         const allImages = document.querySelectorAll('img');
                         
@@ -85,12 +422,20 @@ class AppleMusicScheduleScraper:
                             'div[data-testid], article, section > div, main > div > div'
                         );
                         
+                        // Show blocks pre-split into fields, so Python can skip the HTML parse
+                        const showBlocks = [];
+                        const recorded = new Set();
+                        const timeRangeRe = /\\d{1,2}(?::\\d{2})?(?:\\s*(?:AM|PM))?\\s*[–-]\\s*\\d{1,2}(?::\\d{2})?\\s*(?:AM|PM)/gi;
+                        
                         potentialShows.forEach((element, index) => {
-                            const text = element.textContent.trim();
+                            // Space-joined like get_text(' ', strip=True): textContent runs adjacent
+                            // text nodes together, turning "Hits 2" + "3 – 4 PM" into "23 – 4 PM"
+                            const text = strippedText(element, ' ');
                             
                             // Look for time pattern to identify show blocks - include times with minutes
                             if (text.match(/\\d{1,2}(?::\\d{2})?\\s*(?:AM|PM)?\\s*[–-]\\s*\\d{1,2}(?::\\d{2})?\\s*(?:AM|PM)/i)) {
-                                const key = text.substring(0, 100);
+                                // Canonical key shared with Python: whitespace removed, first 64 chars
+                                const key = text.replace(/\\s+/g, '').substring(0, 64);
                                 
                                 // First, look for picture elements with srcset
                                 const pictures = element.querySelectorAll('picture');
@@ -100,24 +445,14 @@ class AppleMusicScheduleScraper:
                                         const srcset = source.getAttribute('srcset');
                                         if (srcset && srcset.includes('mzstatic.com')) {
                                             // Parse srcset to get the best quality image
-                                            const entries = srcset.split(',');
                                             let bestUrl = null;
                                             let bestSize = 0;
-                                            
-                                            entries.forEach(entry => {
-                                                const parts = entry.trim().split(' ');
-                                                if (parts.length >= 2) {
-                                                    const url = parts[0];
-                                                    const sizeMatch = parts[1].match(/(\\d+)w?/);
-                                                    if (sizeMatch) {
-                                                        const size = parseInt(sizeMatch[1]);
-                                                        if (size > bestSize) {
-                                                            bestSize = size;
-                                                            bestUrl = url;
-                                                        }
-                                                    }
+                                            for (const [, url, size] of srcset.matchAll(/([^\\s,]+)\\s+(\\d+)w/g)) {
+                                                if (+size > bestSize) {
+                                                    bestSize = +size;
+                                                    bestUrl = url;
                                                 }
-                                            });
+                                            }
                                             
                                             if (bestUrl) {
                                                 imageMap[key] = bestUrl;
@@ -131,35 +466,103 @@ class AppleMusicScheduleScraper:
                                     const images = element.querySelectorAll('img');
                                     images.forEach(img => {
                                         const src = img.src;
-                                        if (src && src.length > 10 && !src.endsWith('1x1.gif')) {
+                                        if (src && src.length > 10 && !src.startsWith('data:') && !src.endsWith('1x1.gif')) {
                                             imageMap[key] = src;
                                         }
                                     });
                                 }
+                                
+                                // Record blocks holding exactly one time range (a single show) with the
+                                // text of their title/description elements; Python picks the title and
+                                // description from them with the same rules as extract_show_data
+                                const timeMatches = text.match(timeRangeRe) || [];
+                                let nested = false;
+                                for (let parent = element.parentElement; parent; parent = parent.parentElement) {
+                                    if (recorded.has(parent)) {
+                                        nested = true;
+                                        break;
+                                    }
+                                }
+                                if (timeMatches.length === 1 && !nested) {
+                                    const link = element.querySelector('a[href]');
+                                    recorded.add(element);
+                                    showBlocks.push({
+                                        key: key,
+                                        timeSlot: timeMatches[0],
+                                        titleTexts: Array.from(element.querySelectorAll(selectors.title), el => strippedText(el, '')),
+                                        descTexts: Array.from(element.querySelectorAll(selectors.desc), el => strippedText(el, '')),
+                                        showUrl: link ? link.getAttribute('href') : null,
+                                        rawText: text
+                                    });
+                                }
                             }
                         });
                         
+                        showBlocks.forEach(block => {
+                            block.artwork = imageMap[block.key] || null;
+                        });
+                        
                         return {
-                            imageMap: imageMap
+                            imageMap: imageMap,
+                            shows: showBlocks
                         };
                     }
-                """)
+                """, {'title': _TITLE_SELECTOR, 'desc': _DESC_SELECTOR})
                 
                 actual_image_data = image_data.get('imageMap', {})
+                prefetched_shows = image_data.get('shows', [])
                 
                 # Get the page content
-                html = page.content()
-                context.close()
-                browser.close()
-                return html, actual_image_data
+                html = await page.content()
+                page_data = (html, actual_image_data, prefetched_shows)
+                # Don't pin a half-rendered page (artwork wait timed out, no show blocks) for the TTL
+                if prefetched_shows or actual_image_data:
+                    self._get_cache().set(cache_key, page_data, expire=_CACHE_TTL_SECONDS)
+                return page_data
                 
-        except Exception as e:
-            print(f"Error fetching page {url}: {e}")
-            return None, {}
+            except Exception as e:
+                print(f"Error fetching page {url}: {e}")
+                return None, {}, []
+            finally:
+                if context is not None:
+                    await context.close()
+    
+    def fetch_page(self, url: str) -> tuple[Optional[str], dict]:
+        """Fetch a single Apple Music radio page and extract image URLs (synchronous wrapper around _fetch_one)."""
+        async def run():
+            # The browser is bound to this event loop, so close it before asyncio.run returns
+            try:
+                return await self._fetch_one(url, asyncio.Semaphore(1))
+            finally:
+                await self.close()
+        
+        html, image_data, _ = asyncio.run(run())
+        return html, image_data
     
-    def parse_schedule(self, html: str, image_data: dict = None) -> List[Dict]:
-        """Parse the schedule from HTML content."""
-        soup = BeautifulSoup(html, 'html.parser')
+    def parse_prefetched(self, prefetched_shows: Optional[list], station_name: str = '',
+                         station_url: str = '') -> List[Show]:
+        """Build shows from the blocks the in-page pass split, or [] if they don't form a full schedule."""
+        shows = []
+        for item in prefetched_shows or ():
+            show_data = self._show_from_prefetched(item, station_name, station_url)
+            # One block the fast path can't fully build sends the whole page to the HTML parse
+            if show_data is None:
+                return []
+            if self.is_valid_show(show_data):
+                shows.append(show_data)
+        # A partial pass (e.g. only a hero block) must not replace the full parse
+        return shows if len(shows) >= _MIN_SCHEDULE_SHOWS else []
+    
+    def parse_schedule(self, html: str, image_data: dict = None, prefetched_shows: list = None,
+                       station_name: str = '', station_url: str = '') -> List[Show]:
+        """Parse the schedule from HTML content, or from shows pre-split in the browser when available."""
+        # Fast path: the JS pass already split each show block, so skip the HTML parse
+        shows = self.parse_prefetched(prefetched_shows, station_name, station_url)
+        if shows:
+            return shows
+        
+        # lxml's C parser builds the tree much faster than the pure-Python html.parser
+        soup = BeautifulSoup(html, 'lxml', parse_only=_BODY_ONLY)
         shows = []
         image_data = image_data or {}
         
@@ -198,37 +601,48 @@ class AppleMusicScheduleScraper:
         
         if not schedule_items:
             # Fallback: look for any elements containing time patterns - including LIVE prefix
-            time_elements = soup.find_all(string=re.compile(r'(?:LIVE\s*[·•]?\s*)?\d{1,2}(?::\d{2})?\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM)', re.I))
+            time_elements = soup.find_all(string=_LIVE_TIME_RANGE_RE)
             schedule_items = []
+            seen_ids = set()
+            seen_markup = set()
             for time_elem in time_elements:
                 # Get the parent container that likely contains the full show info
                 parent = time_elem.parent
-                while parent and not any(word in parent.get('class', []) + [parent.name] for word in ['item', 'card', 'container', 'section']):
+                while parent is not None:
+                    if parent.name in _CONTAINER_HINTS or not _CONTAINER_HINTS.isdisjoint(parent.get('class') or ()):
+                        break
                     parent = parent.parent
-                    if parent and parent.name == 'body':
+                    if parent is not None and parent.name == 'body':
                         parent = time_elem.parent
                         break
-                if parent and parent not in schedule_items:
-                    schedule_items.append(parent)
+                # Many time nodes share one container; skip it by identity before paying
+                # to serialize it again
+                if parent is not None and id(parent) not in seen_ids:
+                    seen_ids.add(id(parent))
+                    # bs4 Tags compare by markup, so identical containers (e.g. a repeated
+                    # show block) count once; key on the serialized markup to keep that
+                    markup = str(parent)
+                    if markup not in seen_markup:
+                        seen_markup.add(markup)
+                        schedule_items.append(parent)
         
         for item in schedule_items:
-            show_data = self.extract_show_data(item, image_data)
+            show_data = self.extract_show_data(item, image_data, station_name, station_url)
             if show_data and self.is_valid_show(show_data):
                 shows.append(show_data)
         
         return shows
     
-    def is_valid_show(self, show_data: Dict) -> bool:
+    def is_valid_show(self, show_data: Show) -> bool:
         """Filter out navigation elements and invalid entries."""
-        title = show_data.get('title', '').lower()
+        title = (show_data.title or '').casefold()
         
         # Filter out navigation items
-        nav_items = ['home', 'new', 'radio', 'search', 'sign in']
-        if title in nav_items:
+        if title in _NAV_ITEMS:
             return False
             
         # Must have either a time slot or be a special show
-        if not show_data.get('time_slot') and not any(word in title for word in ['show', 'list', 'takeover', 'hits']):
+        if not show_data.time_slot and not _SHOW_KEYWORD_RE.search(title):
             return False
             
         return True
@@ -248,58 +662,23 @@ class AppleMusicScheduleScraper:
         else:
             return url
     
-    def _parse_time_component(self, time_str: str) -> Tuple[int, int, str]:
-        """Parse a time component like '7:05 PM' or '11PM' into hour, minute, period."""
-        time_str = time_str.strip()
-        
-        # Check for AM/PM attached to time
-        am_pm_match = re.match(r'(\d{1,2})(?::(\d{2}))?(?:\s*)?(AM|PM)', time_str, re.I)
-        if am_pm_match:
-            hour = int(am_pm_match.group(1))
-            minute = int(am_pm_match.group(2) or 0)
-            period = am_pm_match.group(3).upper()
-            return hour, minute, period
-            
-        # Just numbers without AM/PM
-        num_match = re.match(r'(\d{1,2})(?::(\d{2}))?', time_str)
-        if num_match:
-            hour = int(num_match.group(1))
-            minute = int(num_match.group(2) or 0)
-            return hour, minute, None
-            
-        return None, None, None
-    
-    def _convert_12h_to_24h(self, time_slot: str) -> str:
-        """Convert 12-hour format time slot to 24-hour format."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _convert_12h_to_24h(time_slot: str) -> str:
+        """Convert 12-hour format time slot to 24-hour format (memoized, slots repeat)."""
         if not time_slot:
             return time_slot
             
         try:
-            # Parse different time slot formats
-            patterns = [
-                # Pattern 1: Both times have AM/PM with flexible spacing (10:10 PM – 12:15 AM)
-                r'(\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM))',
-                # Pattern 2: Only end time has AM/PM (9 – 10 PM, 10:10 AM – 12PM)
-                r'(\d{1,2}(?::\d{2})?)\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM))',
-                # Pattern 3: No AM/PM on either
-                r'(\d{1,2}(?::\d{2})?)\s*[–-]\s*(\d{1,2}(?::\d{2})?)',
-            ]
-            
-            match = None
-            for pattern in patterns:
-                match = re.match(pattern, time_slot, re.I)
-                if match:
-                    break
-                    
+            # Parse both ends of the slot in a single match
+            match = _TIME_SLOT_12H_RE.match(time_slot)
             if not match:
                 return time_slot
-                
-            start_str = match.group(1)
-            end_str = match.group(2)
             
-            # Parse start and end times
-            start_hour, start_min, start_period = self._parse_time_component(start_str)
-            end_hour, end_min, end_period = self._parse_time_component(end_str)
+            start_hour, start_min = int(match['sh']), int(match['sm'] or 0)
+            end_hour, end_min = int(match['eh']), int(match['em'] or 0)
+            start_period = match['sp'].upper() if match['sp'] else None
+            end_period = match['ep'].upper() if match['ep'] else None
             
             # Infer missing AM/PM periods
             if end_period is None and start_period:
@@ -317,20 +696,9 @@ class AppleMusicScheduleScraper:
                 else:
                     start_period = end_period
             
-            # Convert to 24-hour format
-            if start_period == 'PM' and start_hour != 12:
-                start_hour_24 = start_hour + 12
-            elif start_period == 'AM' and start_hour == 12:
-                start_hour_24 = 0
-            else:
-                start_hour_24 = start_hour
-                
-            if end_period == 'PM' and end_hour != 12:
-                end_hour_24 = end_hour + 12
-            elif end_period == 'AM' and end_hour == 12:
-                end_hour_24 = 0
-            else:
-                end_hour_24 = end_hour
+            # Convert to 24-hour format (12 AM -> 0, 12 PM -> 12)
+            start_hour_24 = start_hour % 12 + _PERIOD_BASE_HOUR[start_period] if start_period else start_hour
+            end_hour_24 = end_hour % 12 + _PERIOD_BASE_HOUR[end_period] if end_period else end_hour
             
             # Format as 24-hour time
             start_formatted = f"{start_hour_24:02d}:{start_min:02d}"
@@ -340,63 +708,43 @@ class AppleMusicScheduleScraper:
             
         except Exception as e:
             # If conversion fails, log the error and return original
-            print(f"Error converting 12h to 24h format '{time_slot}': {e}")
+            logger.debug("Error converting 12h to 24h format %r: %s", time_slot, e)
             return time_slot
     
-    def _convert_utc_to_pacific(self, time_slot_utc: str) -> str:
-        """Convert UTC time slot to Pacific time."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _convert_utc_to_pacific(time_slot_utc: str, offset: int) -> str:
+        """Convert UTC time slot to Pacific time given the UTC offset in hours (memoized, slots repeat)."""
         if not time_slot_utc:
             return None
             
         try:
             # Parse 24-hour format: "23:00 – 01:00"
-            pattern = r'(\d{1,2}):(\d{2})\s*[–-]\s*(\d{1,2}):(\d{2})'
-            match = re.match(pattern, time_slot_utc)
+            match = _TIME_24H_RANGE_RE.match(time_slot_utc)
             
             if not match:
                 # Fallback: try to convert 12h to 24h first if input is still in 12h format
-                if re.search(r'(AM|PM)', time_slot_utc, re.I):
-                    print(f"Warning: UTC time still in 12h format, converting: {time_slot_utc}")
-                    time_slot_utc_24h = self._convert_12h_to_24h(time_slot_utc)
-                    match = re.match(pattern, time_slot_utc_24h)
+                if _AM_PM_RE.search(time_slot_utc):
+                    logger.debug("UTC time still in 12h format, converting: %s", time_slot_utc)
+                    time_slot_utc_24h = AppleMusicScheduleScraper._convert_12h_to_24h(time_slot_utc)
+                    match = _TIME_24H_RANGE_RE.match(time_slot_utc_24h)
                     if not match:
                         return time_slot_utc
                 else:
                     return time_slot_utc
                 
-            start_hour = int(match.group(1))
-            start_min = int(match.group(2))
-            end_hour = int(match.group(3))
-            end_min = int(match.group(4))
-            
-            # Apply Pacific Time offset (UTC-8 for PST, UTC-7 for PDT)  
-            # Determine if we're in Daylight Saving Time
-            pacific_tz = pytz.timezone('America/Los_Angeles')
-            now = datetime.now(pacific_tz)
-            is_dst = bool(now.dst())
-            offset = 7 if is_dst else 8  # PDT is UTC-7, PST is UTC-8
+            start_hour, start_min, end_hour, end_min = map(int, match.groups())
             
-            # Convert UTC to Pacific by subtracting offset
-            pacific_start_hour = start_hour - offset
-            if pacific_start_hour < 0:
-                pacific_start_hour += 24
-            elif pacific_start_hour >= 24:
-                pacific_start_hour -= 24
-                
-            pacific_end_hour = end_hour - offset  
-            if pacific_end_hour < 0:
-                pacific_end_hour += 24
-            elif pacific_end_hour >= 24:
-                pacific_end_hour -= 24
+            # Convert UTC to Pacific by subtracting offset; timedelta handles the wraparound
+            shift = timedelta(hours=offset)
+            start = _CLOCK_BASE + timedelta(hours=start_hour, minutes=start_min) - shift
+            end = _CLOCK_BASE + timedelta(hours=end_hour, minutes=end_min) - shift
             
             # Format with 24-hour time
-            start_formatted = f"{pacific_start_hour:02d}:{start_min:02d}"
-            end_formatted = f"{pacific_end_hour:02d}:{end_min:02d}"
-            
-            return f"{start_formatted} – {end_formatted}"
+            return f"{start.strftime('%H:%M')} – {end.strftime('%H:%M')}"
             
         except Exception as e:
-            print(f"Error converting time: {e}")
+            logger.debug("Error converting time %r: %s", time_slot_utc, e)
             return time_slot_utc
     
     def _clean_title_description(self, text: str, time_slot: str = None, is_description: bool = False, title: str = None) -> str:
@@ -407,7 +755,7 @@ class AppleMusicScheduleScraper:
         cleaned = text
         
         # Remove LIVE prefix variations at start
-        cleaned = re.sub(r'^LIVE\s*[·•]?\s*', '', cleaned, flags=re.I)
+        cleaned = _LIVE_PREFIX_RE.sub('', cleaned)
         
         # Remove time slot from beginning if it exists (exact match)
         if time_slot:
@@ -417,29 +765,29 @@ class AppleMusicScheduleScraper:
         # More comprehensive time pattern removal that handles concatenated cases
         # This handles patterns like "7 – 9 PMThe Show" -> "The Show" and "11PM – 12AM The Show" -> "The Show"
         # Also handles "2:55 – 5:15 AM The Show" -> "The Show"
-        cleaned = re.sub(r'^(?:LIVE\s*[·•]?\s*)?(\d{1,2}(?::\d{2})?\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', '', cleaned, flags=re.I)
+        cleaned = _LEADING_TIME_RANGE_RE.sub('', cleaned)
         
         # Additional cleanup for remaining patterns
-        cleaned = re.sub(r'^(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', '', cleaned, flags=re.I)
+        cleaned = _LEADING_END_PERIOD_RANGE_RE.sub('', cleaned)
         
         # Remove LIVE patterns that appear mid-text
-        cleaned = re.sub(r'LIVE\s*[·•]\s*(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*', '', cleaned, flags=re.I)
+        cleaned = _MID_LIVE_TIME_RE.sub('', cleaned)
         
         # Handle badly concatenated time+title (e.g., "05 – 9 PM7:05 – 9 PMThe Show")
         # Look for repeated time patterns
-        cleaned = re.sub(r'(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))\s*\1\s*', r'\1 ', cleaned, flags=re.I)
+        cleaned = _REPEATED_TIME_RE.sub(r'\1 ', cleaned)
         
         # Final cleanup: if text starts with a time pattern followed immediately by letters, split them
-        time_title_match = re.match(r'^(\d{1,2}(?::\d{2})?\s*[–-]\s*\d{1,2}(?::\d{2})?\s*(?:AM|PM))([A-Za-z].*)$', cleaned, re.I)
+        time_title_match = _TIME_TITLE_SPLIT_RE.match(cleaned)
         if time_title_match:
             cleaned = time_title_match.group(2).strip()
         
         # Handle concatenated words like "ShowHouston's" -> "Show Houston's"
         # Look for common show-ending words immediately followed by capitalized words
-        cleaned = re.sub(r'(Show|List|Hits|Radio|Music)([A-Z][a-z])', r'\1 \2', cleaned)
+        cleaned = _SHOW_ENDING_RE.sub(r'\1 \2', cleaned)
         
         # Handle other common concatenations
-        cleaned = re.sub(r'([a-z])([A-Z][a-z])', r'\1 \2', cleaned)
+        cleaned = _CONCAT_WORD_RE.sub(r'\1 \2', cleaned)
         
         # For descriptions, remove the title from the beginning if it's duplicated
         if is_description and title:
@@ -460,74 +808,117 @@ class AppleMusicScheduleScraper:
         
         return cleaned.strip()
     
-    def extract_show_data(self, element, image_data: dict = None) -> Optional[Dict]:
+    def _make_show(self, time_slot: Optional[str], title: Optional[str], description: Optional[str],
+                   artwork_url: Optional[str], show_url: Optional[str], full_text: str,
+                   station_name: str = '', station_url: str = '') -> Show:
+        """Build a Show for a station, normalizing the time slot to 24-hour format."""
+        # Convert time_slot to 24-hour format
+        time_slot_24h = self._convert_12h_to_24h(time_slot) if time_slot else time_slot
+        
+        return Show(
+            time_slot=time_slot_24h,
+            title=title,
+            description=description,
+            artwork_url=artwork_url,
+            show_url=show_url,
+            raw_text=full_text[:200] + '...' if len(full_text) > 200 else full_text,
+            station=station_name,
+            station_url=station_url
+        )
+    
+    def _pick_title_description(self, title_texts, desc_texts, time_slot: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Choose a title and description from the text of the title and description elements."""
+        title_candidates = []
+        for candidate_text in title_texts:
+            candidate_text = self._clean_title_description(candidate_text, time_slot, is_description=False)
+            if candidate_text and not _BARE_TIME_RANGE_RE.match(candidate_text):
+                title_candidates.append(candidate_text)
+        
+        desc_candidates = []
+        for candidate_text in desc_texts:
+            candidate_text = self._clean_title_description(candidate_text, time_slot, is_description=True)
+            if candidate_text and not _BARE_TIME_RANGE_RE.match(candidate_text):
+                desc_candidates.append(candidate_text)
+        
+        # Take first valid title
+        title = title_candidates[0] if title_candidates else None
+        
+        # Find description that doesn't duplicate the title
+        description = None
+        for desc in desc_candidates:
+            if not title or (desc != title and not desc.startswith(title)):
+                description = desc
+                break
+        
+        return title, description
+    
+    def _finish_description(self, title: Optional[str], description: Optional[str], clean_text: str,
+                            time_slot: Optional[str]) -> Optional[str]:
+        """Strip title duplication from the description, or fall back to the text left after the title."""
+        # Clean up description by removing title duplication
+        if description and title:
+            description = self._clean_title_description(description, time_slot, is_description=True, title=title)
+        
+        # Fallback: extract description from remaining text if not already set
+        if not description and clean_text and title:
+            remaining_text = clean_text
+            if title in remaining_text:
+                # Remove the title from the text to get description
+                remaining_text = remaining_text.replace(title, '', 1).strip()
+            if remaining_text and len(remaining_text) > 5:
+                description = remaining_text
+        
+        return description
+    
+    def _show_from_prefetched(self, item: Dict, station_name: str = '', station_url: str = '') -> Optional[Show]:
+        """Build a Show from a block the browser already isolated, or None if it needs the HTML parse."""
+        time_slot = item.get('timeSlot')
+        title, description = self._pick_title_description(
+            item.get('titleTexts') or (), item.get('descTexts') or (), time_slot
+        )
+        # Blocks without a structural title need the text heuristics in extract_show_data, and
+        # blocks without mapped artwork need its soup fallbacks (background images, attributes)
+        if not title or not item.get('artwork'):
+            return None
+        
+        raw_text = item.get('rawText') or ''
+        clean_text = self._clean_title_description(raw_text, time_slot, is_description=False)
+        description = self._finish_description(title, description, clean_text, time_slot)
+        
+        artwork_url = self._normalize_url(item.get('artwork'))
+        show_url = self._normalize_url(item.get('showUrl'))
+        
+        return self._make_show(time_slot, title, description, artwork_url, show_url, raw_text,
+                               station_name, station_url)
+    
+    def extract_show_data(self, element, image_data: dict = None,
+                          station_name: str = '', station_url: str = '') -> Optional[Show]:
         """Extract show data from a schedule element."""
         try:
             # Get all text content
             full_text = element.get_text(separator=' ', strip=True)
             
-            # Extract time slot using improved regex - handle LIVE prefix and various formats
-            # First, clean up LIVE prefix if present
-            full_text_clean = re.sub(r'^LIVE\s*[·•]?\s*', '', full_text, flags=re.I)
+            # Extract time slot - one scan covers every supported shape (a LIVE
+            # prefix never touches the digits, so the raw text is enough)
+            all_matches = _ANY_TIME_RE.findall(full_text)
             
-            patterns = [
-                r'(\d{1,2}:\d{2}\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}:\d{2}\s*(?:AM|PM))',  # 7:05 PM - 9:00 PM or 7:05 - 9:00 AM
-                r'(\d{1,2}:\d{2}\s*[–-]\s*\d{1,2}:\d{2}\s*(?:AM|PM))',        # 7:05 - 9:00 PM
-                r'(\d{1,2}:\d{2}\s*(?:AM|PM)?\s*[–-]\s*\d{1,2}\s*(?:AM|PM))',  # 7:05 PM - 9 AM or 2:55 - 5:15 AM
-                r'(\d{1,2}\s*(?:AM|PM)\s*[–-]\s*\d{1,2}\s*(?:AM|PM))',        # 11PM - 12AM
-                r'(\d{1,2}:\d{2}\s*[–-]\s*\d{1,2}\s*(?:AM|PM))',              # 7:05 - 9 PM  
-                r'(\d{1,2}\s*[–-]\s*\d{1,2}:\d{2}\s*(?:AM|PM))',              # 7 - 9:00 PM
-                r'(\d{1,2}\s*[–-]\s*\d{1,2}\s*(?:AM|PM))'                     # 7 - 9 PM
-            ]
+            # Nav bars, footers and other broad selector hits carry no time; skip them
+            # before any of the title/artwork work. Untimed special shows ("Takeover",
+            # "Playlist", ...) go on, since is_valid_show keeps them by title keyword
+            if not all_matches and not _SHOW_KEYWORD_RE.search(full_text):
+                return None
             
-            all_matches = []
-            for pattern in patterns:
-                # Try both original and cleaned text
-                matches = re.findall(pattern, full_text, re.I)
-                all_matches.extend(matches)
-                matches_clean = re.findall(pattern, full_text_clean, re.I)
-                all_matches.extend(matches_clean)
+            # Prefer the longest/most complete time pattern
+            time_slot = max(all_matches, key=len) if all_matches else None
             
-            time_slot = None
-            if all_matches:
-                # Prefer the longest/most complete time pattern
-                time_slot = max(all_matches, key=len)
-            
-            # Extract show title and description using improved algorithm
-            title = None
-            description = None
-            
-            # Try HTML-based extraction first to separate title and description
-            # Look for strong elements (bold text) for titles
-            title_candidates = []
-            desc_candidates = []
-            
-            # Find bold/strong elements for titles
-            title_elements = element.select('strong, b, [class*="title"], [class*="heading"], h1, h2, h3, h4, h5, h6')
-            for elem in title_elements:
-                candidate_text = elem.get_text(strip=True)
-                candidate_text = self._clean_title_description(candidate_text, time_slot, is_description=False)
-                if candidate_text and not re.match(r'^\d{1,2}\s*[–-]\s*\d{1,2}\s*(AM|PM)$', candidate_text, re.I):
-                    title_candidates.append(candidate_text)
-            
-            # Find description elements (often in separate elements after title)
-            desc_elements = element.select('p, [class*="description"], [class*="subtitle"], [class*="summary"]')
-            for elem in desc_elements:
-                candidate_text = elem.get_text(strip=True)
-                candidate_text = self._clean_title_description(candidate_text, time_slot, is_description=True)
-                if candidate_text and not re.match(r'^\d{1,2}\s*[–-]\s*\d{1,2}\s*(AM|PM)$', candidate_text, re.I):
-                    desc_candidates.append(candidate_text)
-            
-            # Choose best title and description
-            if title_candidates:
-                title = title_candidates[0]  # Take first valid title
-            
-            if desc_candidates:
-                # Find description that doesn't duplicate the title
-                for desc in desc_candidates:
-                    if not title or (desc != title and not desc.startswith(title)):
-                        description = desc
-                        break
+            # Extract show title and description using improved algorithm.
+            # Try HTML-based extraction first to separate title and description:
+            # bold/heading elements for titles, paragraph-like elements after them
+            title, description = self._pick_title_description(
+                (elem.get_text(strip=True) for elem in self._sel_title.select(element)),
+                (elem.get_text(strip=True) for elem in self._sel_desc.select(element)),
+                time_slot
+            )
             
             # Fallback: Smart extraction from combined text if HTML-based didn't work
             clean_text = self._clean_title_description(full_text, time_slot, is_description=False)
@@ -601,18 +992,7 @@ class AppleMusicScheduleScraper:
                         else:
                             break
             
-            # Clean up description by removing title duplication (if not already extracted above)
-            if description and title:
-                description = self._clean_title_description(description, time_slot, is_description=True, title=title)
-            
-            # Fallback: extract description from remaining text if not already set
-            if not description and clean_text and title:
-                remaining_text = clean_text
-                if title in remaining_text:
-                    # Remove the title from the text to get description
-                    remaining_text = remaining_text.replace(title, '', 1).strip()
-                if remaining_text and len(remaining_text) > 5:
-                    description = remaining_text
+            description = self._finish_description(title, description, clean_text, time_slot)
             
             # Extract artwork URL - comprehensive search for show thumbnails
             artwork_url = None
@@ -620,146 +1000,217 @@ class AppleMusicScheduleScraper:
             
             # First, try to match with the image data extracted via JavaScript
             if image_data:
-                element_text = full_text[:100]
-                for text_key, img_url in image_data.items():
-                    if element_text in text_key or text_key in element_text:
-                        artwork_url = self._normalize_url(img_url)
-                        break
+                # O(1) lookup on the canonical key; only scan a few keys if that misses
+                probe = _image_key(full_text)
+                img_url = image_data.get(probe)
+                if not img_url:
+                    for text_key, candidate_url in itertools.islice(image_data.items(), _IMAGE_KEY_SCAN_LIMIT):
+                        if probe in text_key or text_key in probe:
+                            img_url = candidate_url
+                            break
+                if img_url:
+                    artwork_url = self._normalize_url(img_url)
+            
+            # Collect artwork candidates and the show link in a single pass over the
+            # subtree, then process artwork in priority order: picture/srcset, img,
+            # background-image
+            source_elements = []
+            img_elements = []
+            bg_elements = []
+            link_elem = None
+            for node in element.descendants:
+                if not isinstance(node, Tag):
+                    continue
+                if link_elem is None and node.name == 'a' and node.has_attr('href'):
+                    link_elem = node
+                if artwork_url:
+                    continue
+                if node.name == 'source':
+                    # <source> only ever sits directly inside its <picture>
+                    if node.parent.name == 'picture' and node.has_attr('srcset'):
+                        source_elements.append(node)
+                elif node.name == 'img':
+                    img_elements.append(node)
+                if 'background-image' in node.get('style', '') or 'background-image' in node.get('data-style', ''):
+                    bg_elements.append(node)
             
-            # If not found in image_data, look for picture elements with srcset attributes
+            # If not found in image_data, look for picture sources with srcset containing mzstatic URLs
             if not artwork_url:
-                picture_elements = element.select('picture')
-                for picture_elem in picture_elements:
-                    # Look for source elements with srcset containing mzstatic URLs
-                    source_elements = picture_elem.select('source[srcset]')
-                    for source_elem in source_elements:
-                        srcset = source_elem.get('srcset', '')
-                        if 'mzstatic.com' in srcset:
-                            # Parse srcset to extract the highest quality image URL
-                            srcset_entries = [entry.strip() for entry in srcset.split(',')]
-                            best_url = None
-                            best_size = 0
-                            
-                            for entry in srcset_entries:
-                                parts = entry.strip().split()
-                                if len(parts) >= 2:
-                                    url = parts[0]
-                                    size_str = parts[1]
-                                    # Extract numeric size (e.g., "632w" -> 632)
-                                    size_match = re.match(r'(\d+)w?', size_str)
-                                    if size_match:
-                                        size = int(size_match.group(1))
-                                        if size > best_size:
-                                            best_size = size
-                                            best_url = url
-                            
-                            if best_url:
-                                artwork_url = self._normalize_url(best_url)
-                                break
-                    if artwork_url:
-                        break
+                for source_elem in source_elements:
+                    srcset = source_elem['srcset']
+                    if 'mzstatic.com' in srcset:
+                        # Pick the highest quality image URL by width descriptor
+                        entries = _SRCSET_RE.findall(srcset)
+                        if entries:
+                            artwork_url = self._normalize_url(max(entries, key=lambda e: int(e[1]))[0])
+                            break
             
             # Fallback: look for img elements with actual artwork
             if not artwork_url:
-                img_elements = element.select('img')
                 for img_elem in img_elements:
                     # Try different attributes that might contain the image URL
                     for attr in ['src', 'data-src', 'data-lazy-src', 'data-original', 'srcset', 'data-srcset']:
                         url = img_elem.get(attr)
-                        if url and not url.endswith('1x1.gif'):
-                            # Look for URLs that contain actual image content
-                            if any(keyword in url.lower() for keyword in ['artwork', 'image', 'thumb', 'cover', '.jpg', '.png', '.webp']):
-                                artwork_url = self._normalize_url(url)
-                                break
+                        # Look for URLs that contain actual image content
+                        if _is_artwork_candidate(url) and _ARTWORK_KEYWORDS_RE.search(url):
+                            artwork_url = self._normalize_url(url)
+                            break
                     if artwork_url:
                         break
             
             # Look for background images in any element
             if not artwork_url:
-                bg_elements = element.select('[style*="background-image"], [data-style*="background-image"]')
                 for bg_elem in bg_elements:
-                    style = bg_elem.get('style', '') + bg_elem.get('data-style', '')
-                    bg_match = re.search(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)', style)
+                    # Check each attribute on its own rather than concatenating them
+                    bg_match = _BG_URL_RE.search(bg_elem.get('style', '')) or _BG_URL_RE.search(bg_elem.get('data-style', ''))
                     if bg_match:
                         bg_url = bg_match.group(1)
-                        if not bg_url.endswith('1x1.gif'):
-                            if any(keyword in bg_url.lower() for keyword in ['artwork', 'image', 'thumb', 'cover', '.jpg', '.png', '.webp']):
-                                artwork_url = self._normalize_url(bg_url)
-                                break
+                        if _is_artwork_candidate(bg_url) and _ARTWORK_KEYWORDS_RE.search(bg_url):
+                            artwork_url = self._normalize_url(bg_url)
+                            break
             
             # Look for data attributes that might contain artwork URLs
             if not artwork_url:
-                for attr in element.attrs:
-                    if 'artwork' in attr.lower() or 'image' in attr.lower() or 'thumb' in attr.lower():
-                        url = element.get(attr)
-                        if url and not url.endswith('1x1.gif'):
-                            artwork_url = self._normalize_url(url)
-                            break
+                for attr, url in element.attrs.items():
+                    # Multi-valued attributes (class, rel, ...) come back as lists; only strings can be URLs
+                    if isinstance(url, str) and _is_artwork_candidate(url) and _ATTR_HINT_RE.search(attr):
+                        artwork_url = self._normalize_url(url)
+                        break
             
             # Extract show URL
             show_url = None
-            link_elem = element.select_one('a[href]')
-            if link_elem:
-                show_url = link_elem.get('href')
-                if show_url and not show_url.startswith('http'):
-                    show_url = 'https://music.apple.com' + show_url
+            if link_elem is not None:
+                show_url = self._normalize_url(link_elem.get('href'))
             
             # Only return if we have meaningful data
             if time_slot or title or description:
-                # Convert time_slot to 24-hour format
-                time_slot_24h = self._convert_12h_to_24h(time_slot) if time_slot else time_slot
-                
-                return {
-                    'time_slot': time_slot_24h,
-                    'title': title,
-                    'description': description,
-                    'artwork_url': artwork_url,
-                    'show_url': show_url,
-                    'raw_text': full_text[:200] + '...' if len(full_text) > 200 else full_text
-                }
+                return self._make_show(time_slot, title, description, artwork_url, show_url, full_text,
+                                       station_name, station_url)
         
         except Exception as e:
-            print(f"Error extracting show data: {e}")
+            logger.debug("Error extracting show data: %s", e)
         
         return None
     
-    def scrape_all_stations(self) -> List[Dict]:
-        """Scrape all radio stations and return combined schedule."""
-        all_shows = []
+    async def _try_http(self, url: str, session: aiohttp.ClientSession) -> Optional[str]:
+        """Fetch the server-rendered HTML with a conditional GET, returning None on failure."""
+        # Revalidate against the last body we saw so unchanged pages come back as an empty 304
+        cache_key = hashlib.sha1(f'http:{url}'.encode()).hexdigest()
+        cached = self._get_cache().get(cache_key)
+        headers = {}
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
         
-        for station_name, url in self.stations.items():
-            print(f"Fetching {station_name} schedule from: {url}")
-            
-            html, image_data = self.fetch_page(url)
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    print(f"Page not modified since last fetch: {url}")
+                    return cached['body']
+                if response.status != 200:
+                    print(f"HTTP fetch returned {response.status} for {url}")
+                    return None
+                body = await response.text()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self._get_cache().set(
+                        cache_key,
+                        {'etag': etag, 'last_modified': last_modified, 'body': body},
+                        expire=_HTTP_VALIDATOR_TTL_SECONDS
+                    )
+                return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            return None
+    
+    async def _scrape_station(self, station_name: str, url: str, session: aiohttp.ClientSession,
+                              semaphore: asyncio.Semaphore, executor: ProcessPoolExecutor) -> List[Show]:
+        """Scrape one station, trying plain HTTP first and falling back to the browser."""
+        print(f"Fetching {station_name} schedule from: {url}")
+        loop = asyncio.get_running_loop()
+        
+        # Parsing HTML is CPU-bound, so it runs in the worker processes
+        shows = []
+        html = await self._try_http(url, session)
+        if html:
+            shows = await loop.run_in_executor(executor, parse_schedule, html, None, None, station_name, url)
+        
+        if len(shows) < _MIN_SCHEDULE_SHOWS:
+            html, image_data, prefetched_shows = await self._fetch_one(url, semaphore)
             if not html:
                 print(f"Failed to fetch {station_name}")
-                continue
-                
-            shows = self.parse_schedule(html, image_data)
-            
-            # Add station name to each show
-            for show in shows:
-                show['station'] = station_name
-                show['station_url'] = url
-            
-            print(f"Found {len(shows)} shows for {station_name}")
-            all_shows.extend(shows)
+                return []
+            # The pre-split blocks are cheap to turn into shows here; only ship the
+            # page HTML to a worker when they don't cover the schedule
+            shows = self.parse_prefetched(prefetched_shows, station_name, url)
+            if not shows:
+                shows = await loop.run_in_executor(executor, parse_schedule, html, image_data, None,
+                                                   station_name, url)
+        
+        print(f"Found {len(shows)} shows for {station_name}")
+        return shows
+    
+    async def scrape_all(self) -> List[Show]:
+        """Scrape all radio stations concurrently and return combined schedule."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
+        try:
+            # Workers must not be forked from this process: by the first submit aiohttp's
+            # resolver threads are running, and forking with live threads can deadlock
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            with ProcessPoolExecutor(
+                max_workers=min(len(self.stations), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context(start_method)
+            ) as executor:
+                # One pooled session so all stations reuse the same TCP/TLS connections
+                async with aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=_HTTP_POOL_SIZE, ttl_dns_cache=300),
+                    headers=_HTTP_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT_SECONDS)
+                ) as session:
+                    results = await asyncio.gather(*(
+                        self._scrape_station(station_name, url, session, semaphore, executor)
+                        for station_name, url in self.stations.items()
+                    ))
+        finally:
+            await self.close()
         
+        all_shows = [show for shows in results for show in shows]
         print(f"Total shows found: {len(all_shows)}")
         return all_shows
     
-    def save_to_json(self, shows: List[Dict], filename: str = "apple_music_schedule.json"):
+    def scrape_all_stations(self) -> List[Show]:
+        """Scrape all radio stations and return combined schedule."""
+        return asyncio.run(self.scrape_all())
+    
+    @staticmethod
+    def _to_json(obj) -> bytes:
+        """Encode a value as UTF-8 JSON bytes, using orjson when available."""
+        # orjson produces UTF-8 bytes directly and is much faster; fall back to stdlib json
+        if orjson is not None:
+            return orjson.dumps(obj)
+        # Match orjson's compact separators so the output doesn't depend on which encoder ran
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    def save_to_json(self, shows: List[Show], filename: str = "apple_music_schedule.json"):
         """Save schedule data to JSON file."""
         # Get current time in Pacific Time
-        pacific_tz = pytz.timezone('America/Los_Angeles')
+        pacific_tz = _PACIFIC_TZ
         scraped_at = datetime.now(pacific_tz).isoformat()
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'scraped_at': scraped_at,
-                'stations_scraped': list(self.stations.keys()),
-                'shows': shows
-            }, f, indent=2, ensure_ascii=False)
+        # Stream one show at a time so the whole document is never encoded in memory
+        # (binary mode: the encoded bytes go straight to disk without a decode/encode round trip)
+        with open(filename, 'wb') as f:
+            f.write(b'{\n')
+            f.write(b'  "scraped_at": ' + self._to_json(scraped_at) + b',\n')
+            f.write(b'  "stations_scraped": ' + self._to_json(list(self.stations.keys())) + b',\n')
+            f.write(b'  "shows": [')
+            for i, show in enumerate(shows):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(self._to_json(show.to_dict()))
+            f.write(b'\n  ]\n}\n' if shows else b']\n}\n')
         print(f"Schedule saved to {filename}")
     
     def _parse_time_to_minutes(self, time_str: str) -> int:
@@ -770,15 +1221,10 @@ class AppleMusicScheduleScraper:
         # Remove spaces and convert to uppercase
         time_str = time_str.strip().upper()
         
-        # Handle common time formats more flexibly
-        # Try different patterns
-        patterns = [
-            r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM)',  # 11:30PM or 11PM
-            r'(\d{1,2})(?::(\d{2}))?'             # 11:30 or 11 (assume 24-hour if no AM/PM)
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, time_str)
+        # Handle common time formats more flexibly: 11:30PM or 11PM, then
+        # 11:30 or 11 (assume 24-hour if no AM/PM)
+        for pattern in (_CLOCK_12H_RE, _CLOCK_RE):
+            match = pattern.match(time_str)
             if match:
                 hour = int(match.group(1))
                 minute = int(match.group(2) or 0)
@@ -797,64 +1243,45 @@ class AppleMusicScheduleScraper:
                     
         return -1
     
-    def _detect_time_gaps(self, station_shows: List[Dict]) -> List[Dict]:
+    def _detect_time_gaps(self, station_shows: List[Show]) -> List[Show]:
         """Detect gaps in schedule and insert placeholder entries."""
         if not station_shows:
             return station_shows
             
-        # Parse time slots and sort by start time
-        shows_with_times = []
+        # Parse each slot's start/end minutes once, here rather than per show at
+        # extraction time, since only gap detection needs them
+        timed_shows = []
         for show in station_shows:
-            time_slot = show.get('time_slot', '')
-            if not time_slot:
+            range_match = _TIME_24H_SLOT_RE.match(show.time_slot or '')
+            if not range_match:
                 continue
-                
-            # Extract start and end times
-            time_match = re.search(r'(\d{1,2}(?::\d{2})?\s*(?:AM|PM)?)\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM))', time_slot, re.I)
-            if time_match:
-                start_str = time_match.group(1)
-                end_str = time_match.group(2)
-                
-                # Handle missing AM/PM
-                if 'AM' not in end_str.upper() and 'PM' not in end_str.upper():
-                    # Infer from context
-                    if 'AM' in start_str.upper():
-                        end_str += 'AM'
-                    elif 'PM' in start_str.upper():
-                        end_str += 'PM'
-                
-                start_minutes = self._parse_time_to_minutes(start_str)
-                end_minutes = self._parse_time_to_minutes(end_str)
-                
-                # Handle day rollover
-                if end_minutes < start_minutes:
-                    end_minutes += 24 * 60
-                    
-                shows_with_times.append({
-                    'show': show,
-                    'start': start_minutes,
-                    'end': end_minutes,
-                    'time_slot': time_slot
-                })
+            start_min = self._parse_time_to_minutes(range_match.group(1))
+            end_min = self._parse_time_to_minutes(range_match.group(2))
+            if start_min < 0:
+                continue
+            # Handle day rollover
+            if 0 <= end_min < start_min:
+                end_min += 24 * 60
+            timed_shows.append((start_min, end_min, show))
         
         # Sort by start time
-        shows_with_times.sort(key=lambda x: x['start'])
+        sorted_shows = sorted(timed_shows, key=lambda entry: entry[0])
         
         # Check for gaps and insert placeholders
         result = []
-        for i, current in enumerate(shows_with_times):
-            result.append(current['show'])
+        for i, (_, current_end, current) in enumerate(sorted_shows):
+            result.append(current)
             
             # Check if there's a next show
-            if i < len(shows_with_times) - 1:
-                next_show = shows_with_times[i + 1]
+            if i < len(sorted_shows) - 1:
+                next_start = sorted_shows[i + 1][0]
                 
                 # If there's a gap between current end and next start
-                gap_minutes = next_show['start'] - current['end']
+                gap_minutes = next_start - current_end
                 if gap_minutes > 5:  # Allow 5 minutes tolerance
                     # Calculate gap time slot
-                    gap_start = current['end']
-                    gap_end = next_show['start']
+                    gap_start = current_end
+                    gap_end = next_start
                     
                     # Convert back to time format
                     gap_start_hour = (gap_start // 60) % 24
@@ -871,34 +1298,34 @@ class AppleMusicScheduleScraper:
                     gap_time_slot = f"{gap_start_str} – {gap_end_str}"
                     
                     # Insert gap placeholder
-                    result.append({
-                        'station': current['show'].get('station', ''),
-                        'time_slot': gap_time_slot,
-                        'title': '*** MISSING SHOW ***',
-                        'description': f'Gap detected in schedule from {gap_start_str} to {gap_end_str}',
-                        'artwork_url': '',
-                        'show_url': '',
-                        'station_url': current['show'].get('station_url', '')
-                    })
+                    result.append(Show(
+                        station=current.station,
+                        time_slot=gap_time_slot,
+                        title='*** MISSING SHOW ***',
+                        description=f'Gap detected in schedule from {gap_start_str} to {gap_end_str}',
+                        artwork_url='',
+                        show_url='',
+                        station_url=current.station_url
+                    ))
                     
-                    print(f"WARNING: Gap detected in {current['show'].get('station', '')} schedule: {gap_time_slot}")
+                    print(f"WARNING: Gap detected in {current.station} schedule: {gap_time_slot}")
         
         return result
     
-    def save_to_csv(self, shows: List[Dict], filename: str = "apple_music_schedule.csv"):
+    def save_to_csv(self, shows: List[Show], filename: str = "apple_music_schedule.csv"):
         """Save schedule data to CSV file with gap detection."""
         if not shows:
             print("No shows to save to CSV")
             return
             
         # Get current time in Pacific Time
-        pacific_tz = pytz.timezone('America/Los_Angeles')
+        pacific_tz = _PACIFIC_TZ
         scraped_at = datetime.now(pacific_tz).isoformat()
         
         # Group shows by station and detect gaps
         stations = {}
         for show in shows:
-            station = show.get('station', 'Unknown')
+            station = show.station or 'Unknown'
             if station not in stations:
                 stations[station] = []
             stations[station].append(show)
@@ -909,92 +1336,45 @@ class AppleMusicScheduleScraper:
             # Skip gap detection for now since it's creating false positives
             all_shows_with_gaps.extend(station_shows)
         
-        # Prepare data for CSV with new column order
-        csv_data = []
+        # Prepare rows for CSV with new column order
+        rows = []
         for show in all_shows_with_gaps:
             # Original time from Apple Music (this is already UTC - no conversion needed)
-            time_slot_utc = show.get('time_slot', '')
+            time_slot_utc = show.time_slot or ''
             # Convert UTC to Pacific for display purposes
-            time_slot_pacific = self._convert_utc_to_pacific(time_slot_utc) if '*** MISSING' not in show.get('title', '') else time_slot_utc
+            time_slot_pacific = self._convert_utc_to_pacific(time_slot_utc, self._pacific_offset) if '*** MISSING' not in (show.title or '') else time_slot_utc
             
-            csv_data.append({
-                'station': show.get('station', ''),
+            rows.append({
+                'station': show.station,
                 'time_slot_pacific': time_slot_pacific,
-                'show_title': show.get('title', ''),
-                'description': show.get('description', ''),
-                'show_image_url': show.get('artwork_url', ''),
+                'show_title': show.title,
+                'description': show.description,
+                'show_image_url': show.artwork_url,
                 'time_slot_utc': time_slot_utc,
-                'show_url': show.get('show_url', ''),
+                'show_url': show.show_url,
                 'scraped_at': scraped_at
             })
         
-        # Create DataFrame and sort by station and time
-        df = pd.DataFrame(csv_data)
+        # Sort by station, then by Pacific start time
+        rows.sort(key=lambda row: (row['station'] or '', _time_slot_to_start_minutes(row['time_slot_pacific'])))
         
-        # Add a sorting helper column for Pacific times
-        def time_to_sort_key(time_slot):
-            """Convert Pacific time slot to sorting key (handles both 12h and 24h formats)"""
-            if not time_slot or '***' in str(time_slot):
-                return 9999  # Put gaps at end
-            
-            # Try 24-hour format first: "14:00 – 16:00"
-            time_match_24h = re.search(r'(\d{1,2}):(\d{2})\s*[–-]', str(time_slot))
-            if time_match_24h:
-                hour = int(time_match_24h.group(1))
-                minute = int(time_match_24h.group(2))
-                return hour * 60 + minute
-            
-            # Fallback to 12-hour format parsing
-            time_match = re.search(r'(\d{1,2}(?::\d{2})?)\s*(AM|PM)?\s*[–-]', str(time_slot), re.I)
-            if time_match:
-                start_str = time_match.group(1)
-                period = time_match.group(2)  # AM/PM directly attached to start time
-                
-                # If no AM/PM attached to start time, infer from context
-                if not period:
-                    # Look for AM/PM later in the string for end time
-                    end_match = re.search(r'[–-]\s*\d{1,2}(?::\d{2})?\s*(AM|PM)', str(time_slot), re.I)
-                    if end_match:
-                        end_period = end_match.group(1).upper()
-                        start_hour = int(start_str.split(':')[0])  # Extract just the hour part
-                        if end_period == 'AM' and start_hour >= 10:  # Like "11PM – 1AM"
-                            period = 'PM'  # Late night hours crossing midnight
-                        elif end_period == 'PM' and start_hour <= 8:  # Like "5 – 7PM"  
-                            period = 'PM'  # Afternoon/evening hours
-                        else:
-                            period = end_period  # Default to same as end time
-                    else:
-                        period = 'AM'  # Default
-                else:
-                    period = period.upper()
-                
-                # Parse time
-                if ':' in start_str:
-                    hour, minute = map(int, start_str.split(':'))
-                else:
-                    hour, minute = int(start_str), 0
-                
-                # Convert to 24-hour for sorting
-                if period == 'PM' and hour != 12:
-                    hour += 12
-                elif period == 'AM' and hour == 12:
-                    hour = 0
-                
-                return hour * 60 + minute
-            
-            return 9999
-        
-        df['_sort_key'] = df['time_slot_pacific'].apply(time_to_sort_key)
-        
-        # Sort by station, then by time
-        df = df.sort_values(['station', '_sort_key'])
-        
-        # Remove the sorting helper column
-        df = df.drop('_sort_key', axis=1)
-        
-        df.to_csv(filename, index=False, encoding='utf-8')
+        # Stream rows straight to disk with plain '\n' line endings
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
         print(f"Schedule saved to {filename} (sorted by time)")
 
+@functools.lru_cache(maxsize=1)
+def _worker_scraper() -> AppleMusicScheduleScraper:
+    """One scraper per worker process, reused for every page it parses."""
+    return AppleMusicScheduleScraper()
+
+def parse_schedule(html: str, image_data: dict = None, prefetched_shows: list = None,
+                   station_name: str = '', station_url: str = '') -> List[Show]:
+    """Parse one station page; module-level so it can be dispatched to a worker process."""
+    return _worker_scraper().parse_schedule(html, image_data, prefetched_shows, station_name, station_url)
+
 def main():
     scraper = AppleMusicScheduleScraper()
     shows = scraper.scrape_all_stations()
@@ -1007,7 +1387,7 @@ def main():
         # Group by station
         stations = {}
         for show in shows:
-            station = show.get('station', 'Unknown')
+            station = show.station or 'Unknown'
             if station not in stations:
                 stations[station] = []
             stations[station].append(show)
@@ -1018,7 +1398,7 @@ def main():
         print("\nSample shows:")
         print("-" * 30)
         for i, show in enumerate(shows[:10]):  # Show first 10
-            print(f"[{show.get('station', 'N/A')}] {show.get('time_slot', 'N/A')} - {show.get('title', 'N/A')}")
+            print(f"[{show.station or 'N/A'}] {show.time_slot or 'N/A'} - {show.title or 'N/A'}")
             if i >= 9:
                 break
         
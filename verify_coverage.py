@@ -1,39 +1,28 @@
 #!/usr/bin/env python3
 """Verify 24-hour coverage for each station"""
 
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime, timedelta
 
-def parse_time_to_minutes(time_str):
-    """Convert time string to minutes since midnight"""
-    if not time_str:
-        return -1
-    
-    time_str = time_str.strip().upper()
-    
-    # Try 24-hour format first (HH:MM)
-    match_24h = re.match(r'(\d{1,2}):(\d{2})', time_str)
-    if match_24h:
-        hour = int(match_24h.group(1))
-        minute = int(match_24h.group(2))
-        return hour * 60 + minute
-    
-    # Fallback to 12-hour format
-    match = re.match(r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM)', time_str)
-    if not match:
-        return -1
-    
-    hour = int(match.group(1))
-    minute = int(match.group(2) or 0)
-    period = match.group(3)
-    
-    if period == 'PM' and hour != 12:
-        hour += 12
-    elif period == 'AM' and hour == 12:
-        hour = 0
-    
-    return hour * 60 + minute
+# Time range in the CSV's 24-hour form ("23:00 – 01:00"), or the 12-hour page form ("7 – 9 PM")
+TIME_RANGE_24H = r'(\d{1,2}:\d{2})\s*[–-]\s*(\d{1,2}:\d{2})'
+TIME_RANGE_12H = r'(\d{1,2}(?::\d{2})?\s*(?:AM|PM)?)\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM))'
+
+def parse_times_to_minutes(times):
+    """Convert a Series of time strings to minutes since midnight (-1 where unparseable)"""
+    parts = times.str.strip().str.upper().str.extract(r'^(\d{1,2})(?::(\d{2}))?\s*(AM|PM)?')
+    hour = pd.to_numeric(parts[0])
+    minute = pd.to_numeric(parts[1]).fillna(0)
+    period = parts[2]
+    
+    # 12 AM is midnight, 12 PM is noon
+    hour = hour.where(period.isna(), hour % 12 + np.where(period == 'PM', 12, 0))
+    
+    # A bare hour needs AM/PM to be unambiguous
+    valid = parts[0].notna() & (parts[1].notna() | period.notna())
+    return (hour * 60 + minute).where(valid, -1).astype(int)
 
 def verify_station_coverage(df, station_name):
     """Verify 24-hour coverage for a station"""
@@ -45,71 +34,48 @@ def verify_station_coverage(df, station_name):
     print(f"\n=== {station_name} ===")
     print(f"Total shows (excluding gaps): {len(station_shows)}")
     
-    # Parse all time slots
-    show_times = []
-    for _, show in station_shows.iterrows():
-        time_slot = show['time_slot_utc']  # Use UTC times
-        if not time_slot or 'MISSING' in str(show['show_title']):
-            continue
-            
-        # Extract start and end times - handle both 24h and 12h formats
-        time_match = re.search(r'(\d{1,2}:\d{2})\s*[–-]\s*(\d{1,2}:\d{2})', time_slot, re.I)
-        if not time_match:
-            # Fallback to 12-hour format
-            time_match = re.search(r'(\d{1,2}(?::\d{2})?\s*(?:AM|PM)?)\s*[–-]\s*(\d{1,2}(?::\d{2})?\s*(?:AM|PM))', time_slot, re.I)
-        if time_match:
-            start_str = time_match.group(1).strip()
-            end_str = time_match.group(2).strip()
-            
-            # Handle missing AM/PM
-            if 'AM' not in end_str.upper() and 'PM' not in end_str.upper():
-                if 'AM' in start_str.upper():
-                    end_str += 'AM'
-                elif 'PM' in start_str.upper():
-                    end_str += 'PM'
-            
-            start_minutes = parse_time_to_minutes(start_str)
-            end_minutes = parse_time_to_minutes(end_str)
-            
-            # Handle day rollover
-            if end_minutes < start_minutes:
-                end_minutes += 24 * 60
-            
-            show_times.append({
-                'title': show['show_title'],
-                'time_slot': time_slot,
-                'start': start_minutes,
-                'end': end_minutes,
-                'duration': end_minutes - start_minutes
-            })
+    # Extract start and end times for all slots at once - handle both 24h and 12h formats
+    time_slots = station_shows['time_slot_utc'].astype(str)  # Use UTC times
+    times = time_slots.str.extract(TIME_RANGE_24H)
+    times = times.fillna(time_slots.str.extract(TIME_RANGE_12H, flags=re.I)).dropna()
+    start_str = times[0].str.strip()
+    end_str = times[1].str.strip()
+    
+    # Handle missing AM/PM
+    start_period = start_str.str.upper().str.extract(r'(AM|PM)')[0]
+    end_has_period = end_str.str.upper().str.contains('AM|PM')
+    end_str = end_str.where(end_has_period | start_period.isna(), end_str + start_period)
+    
+    show_times = pd.DataFrame({
+        'title': station_shows.loc[times.index, 'show_title'],
+        'time_slot': time_slots.loc[times.index],
+        'start': parse_times_to_minutes(start_str),
+        'end': parse_times_to_minutes(end_str)
+    })
+    
+    # Handle day rollover
+    show_times['end'] = show_times['end'].where(show_times['end'] >= show_times['start'], show_times['end'] + 24 * 60)
+    show_times['duration'] = show_times['end'] - show_times['start']
     
     # Sort by start time
-    show_times.sort(key=lambda x: x['start'])
+    show_times = show_times.sort_values('start', kind='stable').reset_index(drop=True)
     
     # Check coverage
-    total_coverage = 0
-    gaps = []
+    total_coverage = int(show_times['duration'].sum())
     
-    for i, show in enumerate(show_times):
-        total_coverage += show['duration']
-        
-        # Check for gaps
-        if i < len(show_times) - 1:
-            next_show = show_times[i + 1]
-            gap = next_show['start'] - show['end']
-            
-            if gap > 5:  # More than 5 minutes gap
-                gap_start_hour = show['end'] // 60
-                gap_start_min = show['end'] % 60
-                gap_end_hour = next_show['start'] // 60
-                gap_end_min = next_show['start'] % 60
-                
-                gaps.append({
-                    'gap_minutes': gap,
-                    'after_show': show['title'],
-                    'before_show': next_show['title'],
-                    'gap_time': f"{gap_start_hour:02d}:{gap_start_min:02d} - {gap_end_hour:02d}:{gap_end_min:02d}"
-                })
+    # Check for gaps of more than 5 minutes between consecutive shows
+    starts = show_times['start'].to_numpy()
+    ends = show_times['end'].to_numpy()
+    gap_minutes = starts[1:] - ends[:-1]
+    gaps = []
+    for i in np.flatnonzero(gap_minutes > 5):
+        gap_start, gap_end = ends[i], starts[i + 1]
+        gaps.append({
+            'gap_minutes': int(gap_minutes[i]),
+            'after_show': show_times.at[i, 'title'],
+            'before_show': show_times.at[i + 1, 'title'],
+            'gap_time': f"{gap_start // 60:02d}:{gap_start % 60:02d} - {gap_end // 60:02d}:{gap_end % 60:02d}"
+        })
     
     print(f"Total coverage: {total_coverage} minutes ({total_coverage/60:.1f} hours)")
     print(f"Expected: 1440 minutes (24 hours)")
@@ -124,16 +90,16 @@ def verify_station_coverage(df, station_name):
     
     # Show first few and last few shows
     print(f"\nFirst 5 shows:")
-    for show in show_times[:5]:
-        start_h, start_m = show['start'] // 60, show['start'] % 60
-        end_h, end_m = show['end'] // 60, show['end'] % 60
-        print(f"  {start_h:02d}:{start_m:02d}-{end_h:02d}:{end_m:02d} ({show['duration']}min) - {show['title']}")
+    for show in show_times.head(5).itertuples():
+        start_h, start_m = show.start // 60, show.start % 60
+        end_h, end_m = show.end // 60, show.end % 60
+        print(f"  {start_h:02d}:{start_m:02d}-{end_h:02d}:{end_m:02d} ({show.duration}min) - {show.title}")
     
     print(f"\nLast 5 shows:")
-    for show in show_times[-5:]:
-        start_h, start_m = show['start'] // 60, show['start'] % 60
-        end_h, end_m = show['end'] // 60, show['end'] % 60
-        print(f"  {start_h:02d}:{start_m:02d}-{end_h:02d}:{end_m:02d} ({show['duration']}min) - {show['title']}")
+    for show in show_times.tail(5).itertuples():
+        start_h, start_m = show.start // 60, show.start % 60
+        end_h, end_m = show.end // 60, show.end % 60
+        print(f"  {start_h:02d}:{start_m:02d}-{end_h:02d}:{end_m:02d} ({show.duration}min) - {show.title}")
     
     return total_coverage >= 1430  # Allow for small gaps
 